@@ -1,10 +1,22 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, abort
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
 import logging
-from datetime import datetime
+import queue
+import threading
+from functools import wraps
+import time
+import orjson
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
+from types import MappingProxyType
+from datetime import datetime, timezone
 
 from config import config
 from validators import (
@@ -13,8 +25,26 @@ from validators import (
     validate_pagination_params
 )
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster encode/decode"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default), mimetype=self.mimetype
+        )
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Serve '/api/x/' directly instead of answering with a redirect to '/api/x'
+app.url_map.strict_slashes = False
 CORS(app, origins=['http://localhost:3000', 'http://127.0.0.1:3000'])
 app.config['MAX_CONTENT_LENGTH'] = config.max_content_length
 
@@ -22,7 +52,8 @@ app.config['MAX_CONTENT_LENGTH'] = config.max_content_length
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=[config.rate_limit_default],
-    storage_uri="memory://"
+    storage_uri=config.rate_limit_storage_uri,
+    strategy=config.rate_limit_strategy
 )
 limiter.init_app(app)
 
@@ -33,277 +64,591 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def get_brevo_headers():
-    """Get headers for Brevo API requests"""
-    if not config.brevo_api_key:
-        raise ValidationError("BREVO_API_KEY not found in environment variables")
+# Upper bound on how much of a Brevo error body is decoded for logs and responses
+ERROR_BODY_LIMIT = 1024
+
+def response_preview(response, limit: int = ERROR_BODY_LIMIT) -> str:
+    """Decode at most `limit` bytes of a response body"""
+    return response.content[:limit].decode('utf-8', 'replace')
+
+class LazyResponseText:
+    """Log argument that only decodes a response body if the record is emitted"""
     
-    return {
-        'api-key': config.brevo_api_key,
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    def __init__(self, response, limit: int = ERROR_BODY_LIMIT):
+        self.response = response
+        self.limit = limit
+    
+    def __str__(self):
+        return response_preview(self.response, self.limit)
+
+# Shared HTTP session so Brevo calls reuse pooled keep-alive connections
+brevo_session = requests.Session()
+brevo_adapter = HTTPAdapter(
+    pool_connections=config.http_pool_size,
+    pool_maxsize=config.http_pool_size,
+    max_retries=Retry(
+        total=config.http_max_retries,
+        read=False,  # Raise read timeouts as-is so they map to 504 within one request_timeout
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+)
+brevo_session.mount('https://', brevo_adapter)
+atexit.register(brevo_session.close)
+
+# Static Brevo request headers, built once and attached to the session
+BREVO_HEADERS = MappingProxyType({
+    'api-key': config.brevo_api_key,
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}) if config.brevo_api_key else None
+
+if BREVO_HEADERS:
+    brevo_session.headers.update(BREVO_HEADERS)
+
+# Full URLs for the Brevo endpoints this service calls
+BREVO_URLS = {
+    endpoint: f'{config.brevo_base_url}{endpoint}'
+    for endpoint in ('/account', '/contacts', '/events', '/smtp/email')
+}
+
+class BrevoTimeoutError(Exception):
+    """Brevo did not answer within the configured timeout"""
 
 def make_brevo_request(method: str, endpoint: str, **kwargs):
     """Make a request to Brevo API with proper error handling and timeout"""
-    headers = get_brevo_headers()
-    url = f'{config.brevo_base_url}{endpoint}'
+    if not config.brevo_api_key:
+        raise ValidationError("BREVO_API_KEY not found in environment variables")
+    
+    url = BREVO_URLS.get(endpoint) or f'{config.brevo_base_url}{endpoint}'
     
-    # Set timeout if not provided
+    # Set (connect, read) timeout if not provided
     if 'timeout' not in kwargs:
-        kwargs['timeout'] = config.request_timeout
+        kwargs['timeout'] = (config.request_connect_timeout, config.request_timeout)
     
     try:
-        response = requests.request(method, url, headers=headers, **kwargs)
+        response = brevo_session.request(method, url, **kwargs)
         return response
     except requests.exceptions.Timeout:
-        raise ValidationError("Request to Brevo API timed out")
+        raise BrevoTimeoutError("Request to Brevo API timed out")
     except requests.exceptions.ConnectionError:
         raise ValidationError("Failed to connect to Brevo API")
     except requests.exceptions.RequestException as e:
         raise ValidationError(f"Request failed: {str(e)}")
 
+# Shared worker pool for issuing independent Brevo calls concurrently
+brevo_executor = ThreadPoolExecutor(
+    max_workers=config.brevo_max_concurrency, thread_name_prefix='brevo'
+)
+
+def make_brevo_requests(calls, return_exceptions: bool = False):
+    """
+    Make several Brevo requests concurrently on the shared session
+    
+    Args:
+        calls: Iterable of (method, endpoint, kwargs) tuples
+        return_exceptions: Return BrevoTimeoutError/ValidationError raised by a
+            call in its slot instead of raising it
+        
+    Returns:
+        List of responses (or exceptions) in the same order as calls
+    """
+    futures = [
+        brevo_executor.submit(make_brevo_request, method, endpoint, **kwargs)
+        for method, endpoint, kwargs in calls
+    ]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except (BrevoTimeoutError, ValidationError) as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+@app.before_request
+def reject_oversized_body():
+    """Reject bodies over MAX_CONTENT_LENGTH from the header, before reading them"""
+    max_length = app.config['MAX_CONTENT_LENGTH']
+    if request.content_length is not None and request.content_length > max_length:
+        abort(413)
+
+class BrevoAPIError(Exception):
+    """Brevo answered with an unexpected status code"""
+    
+    def __init__(self, message: str, response):
+        super().__init__(f'{message}: {response.status_code}')
+        self.message = message
+        self.response = response
+        self.status_code = response.status_code
+
+def brevo_endpoint(f):
+    """Translate errors raised by a Brevo endpoint into JSON error responses"""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except ValidationError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        except BrevoTimeoutError as e:
+            logger.error("Brevo API timeout: %s", e)
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 504
+        except BrevoAPIError as e:
+            logger.error("Brevo API error: %s - %s", e.status_code, LazyResponseText(e.response))
+            return jsonify({
+                'status': 'error',
+                'message': f'{e.message}: {e.status_code}',
+                'details': response_preview(e.response)
+            }), e.status_code
+        except Exception as e:
+            logger.error("Unexpected error: %s", e)
+            return jsonify({
+                'status': 'error',
+                'message': 'An unexpected error occurred'
+            }), 500
+    return wrapper
+
+# (epoch second, ISO string) of the last formatted timestamp
+_timestamp_cache = (0, '')
+
+def utc_timestamp() -> str:
+    """Current UTC time in ISO format, formatted at most once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+    return _timestamp_cache[1]
+
+# Configuration is loaded once at startup, so its health summary is fixed
+CONFIG_ERRORS = config.validate()
+API_KEY_CONFIGURED = bool(config.brevo_api_key)
+SENDER_EMAIL_CONFIGURED = bool(config.brevo_sender_email)
+
+# (timestamp, encoded body) of the last health check response
+_health_cache = ('', b'')
+
 @app.route('/', methods=['GET'])
 @limiter.exempt
 def health_check():
     """Health check endpoint"""
-    config_errors = config.validate()
+    global _health_cache
+    timestamp = utc_timestamp()
+    # Only the timestamp varies, so re-encode the body at most once per second
+    if timestamp is not _health_cache[0]:
+        _health_cache = (timestamp, orjson.dumps({
+            'status': 'success' if not CONFIG_ERRORS else 'warning',
+            'message': 'Brevo API Integration Service is running',
+            'timestamp': timestamp,
+            'api_key_configured': API_KEY_CONFIGURED,
+            'sender_email_configured': SENDER_EMAIL_CONFIGURED,
+            'configuration_errors': CONFIG_ERRORS
+        }))
     
-    return jsonify({
-        'status': 'success' if not config_errors else 'warning',
-        'message': 'Brevo API Integration Service is running',
-        'timestamp': datetime.utcnow().isoformat(),
-        'api_key_configured': bool(config.brevo_api_key),
-        'sender_email_configured': bool(config.brevo_sender_email),
-        'configuration_errors': config_errors
-    })
+    return app.response_class(
+        _health_cache[1],
+        mimetype='application/json',
+        headers={'Cache-Control': 'no-store'}
+    )
+
+# Account info changes rarely, so keep it briefly per API key
+_account_cache = {}
+_account_cache_lock = threading.Lock()
+_account_fetches = {}  # API key -> Future of the in-flight Brevo call
+
+def get_cached_account():
+    """Return cached account data if it has not expired"""
+    entry = _account_cache.get(config.brevo_api_key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def cache_account(account):
+    """Store account data for config.account_cache_ttl seconds"""
+    if config.account_cache_ttl > 0:
+        with _account_cache_lock:
+            _account_cache[config.brevo_api_key] = (
+                time.monotonic() + config.account_cache_ttl, account
+            )
+
+def fetch_account():
+    """Fetch and project account information from Brevo"""
+    response = make_brevo_request('GET', '/account')
+    
+    if response.status_code != 200:
+        raise BrevoAPIError('Brevo API error', response)
+    
+    data = orjson.loads(response.content)
+    plans = data.get('plan')
+    plan = plans[0] if plans else {}
+    return {
+        'email': data.get('email', 'N/A'),
+        'firstName': data.get('firstName', 'N/A'),
+        'lastName': data.get('lastName', 'N/A'),
+        'companyName': data.get('companyName', 'N/A'),
+        'plan': plan.get('type', 'N/A'),
+        'emailCredits': plan.get('creditsLeft', 'N/A')
+    }
+
+def fetch_account_shared():
+    """Fetch account information, sharing one Brevo call (and its failure) between concurrent callers"""
+    key = config.brevo_api_key
+    with _account_cache_lock:
+        account = get_cached_account()
+        if account is not None:
+            return account
+        future = _account_fetches.get(key)
+        owner = future is None
+        if owner:
+            future = _account_fetches[key] = Future()
+    
+    if owner:
+        try:
+            account = fetch_account()
+            cache_account(account)
+            future.set_result(account)
+        except BaseException as e:
+            # Resolve waiters even on gevent Timeout/GreenletExit, then let it propagate
+            future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            with _account_cache_lock:
+                del _account_fetches[key]
+    
+    return future.result()
 
 @app.route('/api/account', methods=['GET'])
+@brevo_endpoint
 def get_account_info():
     """Get Brevo account information"""
-    try:
-        response = make_brevo_request('GET', '/account')
-        
-        if response.status_code == 200:
-            data = response.json()
-            return jsonify({
-                'status': 'success',
-                'data': {
-                    'email': data.get('email', 'N/A'),
-                    'firstName': data.get('firstName', 'N/A'),
-                    'lastName': data.get('lastName', 'N/A'),
-                    'companyName': data.get('companyName', 'N/A'),
-                    'plan': data.get('plan', [{}])[0].get('type', 'N/A') if data.get('plan') else 'N/A',
-                    'emailCredits': data.get('plan', [{}])[0].get('creditsLeft', 'N/A') if data.get('plan') else 'N/A'
-                }
-            })
+    account = get_cached_account()
+    if account is None:
+        if config.account_cache_ttl > 0:
+            account = fetch_account_shared()
         else:
-            logger.error(f"Brevo API error: {response.status_code} - {response.text}")
-            return jsonify({
-                'status': 'error',
-                'message': f'Brevo API error: {response.status_code}',
-                'details': response.text
-            }), response.status_code
-            
-    except ValidationError as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 400
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'An unexpected error occurred'
-        }), 500
+            account = fetch_account()
+    
+    return jsonify({'status': 'success', 'data': account})
+
+def build_event_payload(data):
+    """
+    Validate a custom event and build the Brevo /events payload
+    
+    Args:
+        data: Event fields as sent by the client
+        
+    Returns:
+        Payload dictionary for Brevo's /events endpoint
+        
+    Raises:
+        ValidationError: If the event is invalid
+    """
+    if not isinstance(data, dict):
+        raise ValidationError('Event must be a JSON object')
+    
+    validate_request_data(data, ['event_name', 'email_id'])
+    
+    # Validate and clean inputs
+    event_name = validate_event_name(data['event_name'])
+    email_id = validate_email_address(data['email_id'])
+    
+    # Validate optional JSON fields
+    contact_properties = validate_json_field(
+        data.get('contact_properties', ''), 'contact_properties'
+    )
+    event_properties = validate_json_field(
+        data.get('event_properties', ''), 'event_properties'
+    )
+    
+    # Prepare event payload
+    event_payload = {
+        'event_name': event_name,
+        'event_date': data.get('event_date') or utc_timestamp(),
+        'identifiers': {'email_id': email_id}
+    }
+    
+    # Add optional properties
+    if contact_properties:
+        event_payload['contact_properties'] = contact_properties
+    if event_properties:
+        event_payload['event_properties'] = event_properties
+    
+    # Add other identifiers if provided
+    if data.get('phone_id'):
+        event_payload['identifiers']['phone_id'] = data.get('phone_id')
+    if data.get('ext_id'):
+        event_payload['identifiers']['ext_id'] = data.get('ext_id')
+    
+    return event_payload
+
+# Events accepted with 202 and forwarded to Brevo by background workers
+_event_queue = queue.Queue(maxsize=config.event_queue_size)
+_event_workers = []
+_event_workers_lock = threading.Lock()
+
+def _deliver_queued_events():
+    """Worker loop forwarding queued event payloads to Brevo"""
+    while True:
+        event_payload = _event_queue.get()
+        try:
+            response = make_brevo_request('POST', '/events', json=event_payload)
+            if response.status_code != 204:
+                logger.error("Brevo API error: %s - %s", response.status_code, LazyResponseText(response))
+        except Exception as e:
+            logger.error("Failed to deliver queued event: %s", e)
+        finally:
+            _event_queue.task_done()
+
+def _drain_event_queue():
+    """Wait up to config.event_drain_timeout for queued events at shutdown"""
+    deadline = time.monotonic() + config.event_drain_timeout
+    with _event_queue.all_tasks_done:
+        while _event_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning("Dropping %s undelivered events at shutdown", _event_queue.unfinished_tasks)
+                return
+            _event_queue.all_tasks_done.wait(remaining)
+
+def enqueue_event(event_payload) -> bool:
+    """Queue an event for background delivery, returning False if the queue is full"""
+    if not _event_workers:
+        # Start lazily so workers are created in the serving process, not before a fork
+        with _event_workers_lock:
+            if not _event_workers:
+                for i in range(config.event_workers):
+                    worker = threading.Thread(
+                        target=_deliver_queued_events, name=f'brevo-events-{i}', daemon=True
+                    )
+                    worker.start()
+                    _event_workers.append(worker)
+                atexit.register(_drain_event_queue)
+    
+    try:
+        _event_queue.put_nowait(event_payload)
+    except queue.Full:
+        return False
+    return True
+
+# Single and batch event routes draw from the same per-client event budget
+EVENT_LIMIT_SCOPE = 'custom-events'
+
+def batch_event_count() -> int:
+    """Rate limit cost of a batch: the number of events it contains"""
+    data = request.get_json(silent=True)
+    events = data.get('events') if isinstance(data, dict) else None
+    return len(events) if isinstance(events, list) and events else 1
 
 @app.route('/api/send-custom-event', methods=['POST'])
-@limiter.limit(config.rate_limit_events)
+@limiter.shared_limit(config.rate_limit_events, scope=EVENT_LIMIT_SCOPE)
+@brevo_endpoint
 def send_custom_event():
     """Send a custom event to Brevo"""
-    try:
-        # Get and validate request data
-        data = request.get_json()
-        if not data:
-            raise ValidationError('Request body is required')
-        
-        validate_request_data(data, ['event_name', 'email_id'])
-        
-        # Validate and clean inputs
-        event_name = validate_event_name(data['event_name'])
-        email_id = validate_email_address(data['email_id'])
-        
-        # Validate optional JSON fields
-        contact_properties = validate_json_field(
-            data.get('contact_properties', ''), 'contact_properties'
-        )
-        event_properties = validate_json_field(
-            data.get('event_properties', ''), 'event_properties'
-        )
-        
-        # Prepare event payload
-        event_payload = {
-            'event_name': event_name,
-            'event_date': data.get('event_date', datetime.utcnow().isoformat()),
-            'identifiers': {'email_id': email_id}
-        }
-        
-        # Add optional properties
-        if contact_properties:
-            event_payload['contact_properties'] = contact_properties
-        if event_properties:
-            event_payload['event_properties'] = event_properties
-        
-        # Add other identifiers if provided
-        if data.get('phone_id'):
-            event_payload['identifiers']['phone_id'] = data.get('phone_id')
-        if data.get('ext_id'):
-            event_payload['identifiers']['ext_id'] = data.get('ext_id')
-        
-        response = make_brevo_request('POST', '/events', json=event_payload)
-        
-        if response.status_code == 204:  # Brevo returns 204 for successful event creation
-            return jsonify({
-                'status': 'success',
-                'message': 'Custom event sent successfully',
-                'data': {
-                    'event_name': event_name,
-                    'email_id': email_id
-                }
-            })
-        else:
-            logger.error(f"Brevo API error: {response.status_code} - {response.text}")
+    # Get and validate request data
+    data = request.get_json(cache=False)
+    if not data:
+        raise ValidationError('Request body is required')
+    
+    event_payload = build_event_payload(data)
+    event_data = {
+        'event_name': event_payload['event_name'],
+        'email_id': event_payload['identifiers']['email_id']
+    }
+    
+    if config.async_events:
+        # Fail now rather than accept events the workers cannot deliver
+        if not config.brevo_api_key:
+            raise ValidationError("BREVO_API_KEY not found in environment variables")
+        if not enqueue_event(event_payload):
             return jsonify({
                 'status': 'error',
-                'message': f'Failed to send event: {response.status_code}',
-                'details': response.text
-            }), response.status_code
-            
-    except ValidationError as e:
+                'message': 'Event queue is full. Please try again later.'
+            }), 503
         return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 400
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+            'status': 'queued',
+            'message': 'Custom event queued for delivery',
+            'data': event_data
+        }), 202
+    
+    response = make_brevo_request('POST', '/events', json=event_payload)
+    
+    if response.status_code != 204:  # Brevo returns 204 for successful event creation
+        raise BrevoAPIError('Failed to send event', response)
+    
+    return jsonify({
+        'status': 'success',
+        'message': 'Custom event sent successfully',
+        'data': event_data
+    })
+
+@app.route('/api/send-custom-events', methods=['POST'])
+@limiter.shared_limit(config.rate_limit_events, scope=EVENT_LIMIT_SCOPE, cost=batch_event_count)
+@brevo_endpoint
+def send_custom_events():
+    """Send a batch of custom events to Brevo concurrently"""
+    # Reuse the body already parsed for the rate limit cost
+    data = request.get_json()
+    if not data:
+        raise ValidationError('Request body is required')
+    
+    events = data.get('events') if isinstance(data, dict) else None
+    if not events or not isinstance(events, list):
+        raise ValidationError('events must be a non-empty list')
+    if len(events) > config.max_batch_events:
+        raise ValidationError(f'A batch can contain at most {config.max_batch_events} events')
+    
+    # Validate every event before sending any of them
+    payloads = []
+    invalid = []
+    for index, event in enumerate(events):
+        try:
+            payloads.append(build_event_payload(event))
+        except ValidationError as e:
+            invalid.append(f'events[{index}]: {e}')
+    if invalid:
+        raise ValidationError(f"Invalid events: {'; '.join(invalid)}")
+    if not config.brevo_api_key:
+        raise ValidationError("BREVO_API_KEY not found in environment variables")
+    
+    # Report transport failures per event: the other events were still sent
+    responses = make_brevo_requests(
+        (('POST', '/events', {'json': payload}) for payload in payloads),
+        return_exceptions=True
+    )
+    
+    errors = []
+    for index, response in enumerate(responses):
+        if isinstance(response, Exception):
+            logger.error("Failed to send events[%s]: %s", index, response)
+            errors.append({
+                'index': index,
+                'status': 504 if isinstance(response, BrevoTimeoutError) else 502,
+                'details': str(response)
+            })
+        elif response.status_code != 204:
+            logger.error("Brevo API error: %s - %s", response.status_code, LazyResponseText(response))
+            errors.append({
+                'index': index,
+                'status': response.status_code,
+                'details': response_preview(response)
+            })
+    
+    result = {
+        'processed': len(payloads) - len(errors),
+        'failed': len(errors),
+        'errors': errors
+    }
+    if errors:
         return jsonify({
             'status': 'error',
-            'message': 'An unexpected error occurred'
-        }), 500
+            'message': f'Failed to send {len(errors)} of {len(payloads)} events',
+            'data': result
+        }), 502
+    
+    return jsonify({
+        'status': 'success',
+        'message': f'{len(payloads)} custom events sent successfully',
+        'data': result
+    })
+
+CONTACT_FIELDS = ('id', 'email', 'attributes', 'listIds', 'createdAt', 'modifiedAt')
+_get_contact_fields = itemgetter(*CONTACT_FIELDS)
+
+def project_contact(contact):
+    """Keep only the contact fields exposed by this API"""
+    try:
+        # Fast path: Brevo normally returns every field
+        return dict(zip(CONTACT_FIELDS, _get_contact_fields(contact)))
+    except KeyError:
+        return {
+            'id': contact.get('id'),
+            'email': contact.get('email'),
+            'attributes': contact.get('attributes', {}),
+            'listIds': contact.get('listIds', []),
+            'createdAt': contact.get('createdAt'),
+            'modifiedAt': contact.get('modifiedAt')
+        }
 
 @app.route('/api/contacts', methods=['GET'])
+@brevo_endpoint
 def get_contacts():
     """Get contacts from Brevo"""
-    try:
-        # Get and validate query parameters
-        limit = request.args.get('limit', 10, type=int)
-        offset = request.args.get('offset', 0, type=int)
-        
-        limit, offset = validate_pagination_params(limit, offset)
-        
-        params = {'limit': limit, 'offset': offset}
-        
-        response = make_brevo_request('GET', '/contacts', params=params)
-        
-        if response.status_code == 200:
-            data = response.json()
-            return jsonify({
-                'status': 'success',
-                'data': {
-                    'totalCount': data.get('count', 0),
-                    'contacts': [{
-                        'id': contact.get('id'),
-                        'email': contact.get('email'),
-                        'attributes': contact.get('attributes', {}),
-                        'listIds': contact.get('listIds', []),
-                        'createdAt': contact.get('createdAt'),
-                        'modifiedAt': contact.get('modifiedAt')
-                    } for contact in data.get('contacts', [])]
-                }
-            })
-        else:
-            logger.error(f"Brevo API error: {response.status_code} - {response.text}")
-            return jsonify({
-                'status': 'error',
-                'message': f'Brevo API error: {response.status_code}',
-                'details': response.text
-            }), response.status_code
-            
-    except ValidationError as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 400
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'An unexpected error occurred'
-        }), 500
+    # Get and validate query parameters
+    limit = request.args.get('limit', 10, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    
+    limit, offset = validate_pagination_params(limit, offset)
+    
+    params = {'limit': limit, 'offset': offset}
+    
+    response = make_brevo_request('GET', '/contacts', params=params)
+    
+    if response.status_code != 200:
+        raise BrevoAPIError('Brevo API error', response)
+    
+    data = orjson.loads(response.content)
+    return jsonify({
+        'status': 'success',
+        'data': {
+            'totalCount': data.get('count', 0),
+            'contacts': [project_contact(contact) for contact in data.get('contacts', ())]
+        }
+    })
 
 @app.route('/api/send-test-email', methods=['POST'])
 @limiter.limit(config.rate_limit_email)
+@brevo_endpoint
 def send_test_email():
     """Send a test email via Brevo"""
-    try:
-        # Check if sender email is configured
-        if not config.brevo_sender_email:
-            raise ValidationError('Sender email not configured. Please set BREVO_SENDER_EMAIL in environment variables.')
-        
-        # Get and validate request data
-        data = request.get_json()
-        if not data:
-            raise ValidationError('Request body is required')
-        
-        validate_request_data(data, ['to'])
-        
-        # Validate and clean inputs
-        to_email = validate_email_address(data['to'])
-        subject = data.get('subject', 'Test Email from Brevo API').strip()
-        content = sanitize_html_content(data.get('content', '<p>This is a test email sent via Brevo API integration.</p>'))
-        
-        # Validate subject length
-        if len(subject) > 255:
-            raise ValidationError('Subject must be 255 characters or less')
-        
-        # Prepare email payload
-        email_payload = {
-            'sender': {
-                'name': config.brevo_sender_name,
-                'email': config.brevo_sender_email
-            },
-            'to': [{'email': to_email}],
-            'subject': subject,
-            'htmlContent': content
-        }
-        
-        response = make_brevo_request('POST', '/smtp/email', json=email_payload)
-        
-        if response.status_code == 201:
-            return jsonify({
-                'status': 'success',
-                'message': 'Test email sent successfully',
-                'data': response.json()
-            })
-        else:
-            logger.error(f"Brevo API error: {response.status_code} - {response.text}")
-            return jsonify({
-                'status': 'error',
-                'message': f'Failed to send email: {response.status_code}',
-                'details': response.text
-            }), response.status_code
-            
-    except ValidationError as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 400
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'An unexpected error occurred'
-        }), 500
+    # Check if sender email is configured
+    if not config.brevo_sender_email:
+        raise ValidationError('Sender email not configured. Please set BREVO_SENDER_EMAIL in environment variables.')
+    
+    # Get and validate request data
+    data = request.get_json(cache=False)
+    if not data:
+        raise ValidationError('Request body is required')
+    
+    validate_request_data(data, ['to'])
+    
+    # Validate and clean inputs
+    to_email = validate_email_address(data['to'])
+    subject = data.get('subject', 'Test Email from Brevo API').strip()
+    content = sanitize_html_content(data.get('content', '<p>This is a test email sent via Brevo API integration.</p>'))
+    
+    # Validate subject length
+    if len(subject) > 255:
+        raise ValidationError('Subject must be 255 characters or less')
+    
+    # Prepare email payload
+    email_payload = {
+        'sender': {
+            'name': config.brevo_sender_name,
+            'email': config.brevo_sender_email
+        },
+        'to': [{'email': to_email}],
+        'subject': subject,
+        'htmlContent': content
+    }
+    
+    response = make_brevo_request('POST', '/smtp/email', json=email_payload)
+    
+    if response.status_code != 201:
+        raise BrevoAPIError('Failed to send email', response)
+    
+    return jsonify({
+        'status': 'success',
+        'message': 'Test email sent successfully',
+        'data': orjson.loads(response.content)
+    })
 
 @app.errorhandler(404)
 def not_found(error):
@@ -319,6 +664,13 @@ def internal_error(error):
         'message': 'Internal server error'
     }), 500
 
+@app.errorhandler(413)
+def request_too_large(error):
+    return jsonify({
+        'status': 'error',
+        'message': 'Request body too large'
+    }), 413
+
 @app.errorhandler(ValidationError)
 def handle_validation_error(e):
     return jsonify({
@@ -338,12 +690,16 @@ if __name__ == '__main__':
     # Validate configuration
     config_errors = config.validate()
     if config_errors:
-        logger.warning(f"Configuration issues: {', '.join(config_errors)}")
+        logger.warning("Configuration issues: %s", ', '.join(config_errors))
         for error in config_errors:
             print(f"⚠️  Warning: {error}")
     else:
         logger.info("Configuration validated successfully")
-        logger.info(f"Brevo sender email: {config.brevo_sender_email}")
+        logger.info("Brevo sender email: %s", config.brevo_sender_email)
+    
+    if config.is_production:
+        logger.warning("Flask development server is not meant for production; "
+                       "use: gunicorn -c gunicorn.conf.py wsgi:app")
     
     # Run the app
     app.run(
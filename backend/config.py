@@ -29,10 +29,26 @@ class Config:
     rate_limit_default: str = "200 per day, 50 per hour"
     rate_limit_email: str = "5 per minute"
     rate_limit_events: str = "10 per minute"
+    rate_limit_storage_uri: str = "memory://"
+    rate_limit_strategy: str = "moving-window"
     
     # Request settings
-    request_timeout: int = 10
+    request_connect_timeout: float = 3.05
+    request_timeout: int = 10  # read timeout
+    http_pool_size: int = 50
+    http_max_retries: int = 3
+    brevo_max_concurrency: int = 8
+    
+    # Background event delivery (send-custom-event returns 202 immediately)
+    async_events: bool = False
+    event_queue_size: int = 10000
+    event_workers: int = 4
+    event_drain_timeout: float = 10.0  # seconds to flush the queue at shutdown
     max_content_length: int = 16 * 1024 * 1024  # 16MB
+    max_batch_events: int = 100
+    
+    # Cache settings
+    account_cache_ttl: int = 30  # seconds, 0 disables
     
     def __post_init__(self):
         """Load values from environment variables"""
@@ -45,6 +61,12 @@ class Config:
         self.flask_host = os.getenv('FLASK_HOST', self.flask_host)
         self.flask_port = int(os.getenv('FLASK_PORT', self.flask_port))
         
+        self.rate_limit_storage_uri = os.getenv('RATELIMIT_STORAGE_URI', self.rate_limit_storage_uri)
+        
+        self.http_pool_size = int(os.getenv('BREVO_HTTP_POOL_SIZE', self.http_pool_size))
+        self.async_events = os.getenv('BREVO_ASYNC_EVENTS', 'False').lower() == 'true'
+        self.account_cache_ttl = int(os.getenv('ACCOUNT_CACHE_TTL', self.account_cache_ttl))
+        
     def validate(self) -> list[str]:
         """Validate configuration and return list of errors"""
         errors = []
@@ -3,8 +3,18 @@ Tests for Flask application endpoints
 """
 import pytest
 import json
+import queue
+import threading
+import time
+import orjson
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, Mock
-from app import app
+from app import (
+    app, brevo_session, brevo_adapter, make_brevo_request, make_brevo_requests,
+    utc_timestamp, LazyResponseText, BrevoTimeoutError, _account_cache, _event_queue,
+    _drain_event_queue, fetch_account_shared, limiter
+)
 from config import config
 
 
@@ -23,9 +33,129 @@ def mock_config():
         mock_cfg.brevo_api_key = "test_api_key"
         mock_cfg.brevo_sender_email = "test@example.com"
         mock_cfg.brevo_sender_name = "Test Sender"
+        mock_cfg.account_cache_ttl = 30
+        mock_cfg.max_batch_events = 100
+        mock_cfg.async_events = False
+        mock_cfg.event_workers = 2
         yield mock_cfg
 
 
+@pytest.fixture(autouse=True)
+def clear_account_cache():
+    """Start every test with an empty account cache"""
+    _account_cache.clear()
+    yield
+    _account_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Start every test with fresh rate limit counters"""
+    limiter.reset()
+    yield
+
+
+class TestMakeBrevoRequest:
+    @patch("app.brevo_session")
+    def test_uses_shared_session(self, mock_session, mock_config):
+        """Test Brevo calls go through the pooled session"""
+        mock_config.brevo_base_url = "https://api.brevo.com/v3"
+        mock_config.request_connect_timeout = 3.05
+        mock_config.request_timeout = 10
+
+        make_brevo_request("GET", "/account")
+
+        mock_session.request.assert_called_once()
+        args, kwargs = mock_session.request.call_args
+        assert args == ("GET", "https://api.brevo.com/v3/account")
+        assert kwargs["timeout"] == (3.05, 10)
+
+    @patch("app.brevo_session")
+    def test_timeout_returns_504(self, mock_session, client, mock_config):
+        """Test an upstream timeout is reported as a gateway timeout"""
+        mock_config.request_connect_timeout = 3.05
+        mock_config.request_timeout = 10
+        mock_config.account_cache_ttl = 0
+        mock_session.request.side_effect = requests.exceptions.Timeout()
+
+        response = client.get("/api/account")
+
+        assert response.status_code == 504
+        data = json.loads(response.data)
+        assert data["message"] == "Request to Brevo API timed out"
+
+    def test_read_timeout_through_adapter_returns_504(self, client, mock_config):
+        """Test a GET read timeout is not retried by the adapter and maps to 504"""
+        hits = []
+
+        class SlowHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                time.sleep(1)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        mock_config.brevo_base_url = f"http://127.0.0.1:{server.server_port}"
+        mock_config.request_connect_timeout = 1
+        mock_config.request_timeout = 0.2
+        mock_config.account_cache_ttl = 0
+        original_adapter = brevo_session.adapters["http://"]
+        try:
+            with patch.dict("app.BREVO_URLS", clear=True):
+                brevo_session.mount("http://", brevo_adapter)
+                response = client.get("/api/account")
+        finally:
+            brevo_session.mount("http://", original_adapter)
+            server.shutdown()
+            server.server_close()
+
+        assert response.status_code == 504
+        assert hits == ["/account"]
+
+
+class TestMakeBrevoRequests:
+    @patch("app.make_brevo_request")
+    def test_results_keep_call_order(self, mock_request):
+        """Test concurrent Brevo calls return responses in call order"""
+        mock_request.side_effect = lambda method, endpoint, **kwargs: endpoint
+
+        results = make_brevo_requests([
+            ("GET", "/account", {}),
+            ("GET", "/contacts", {"params": {"limit": 5}}),
+        ])
+
+        assert results == ["/account", "/contacts"]
+        mock_request.assert_any_call("GET", "/contacts", params={"limit": 5})
+
+
+class TestLazyResponseText:
+    def test_body_truncated_when_formatted(self):
+        """Test the response body is only read and truncated on formatting"""
+        mock_response = Mock()
+        mock_response.content = b"x" * 2000
+
+        lazy = LazyResponseText(mock_response)
+
+        assert str(lazy) == "x" * 1024
+
+
+class TestUtcTimestamp:
+    @patch("app.time.time")
+    def test_timestamp_reused_within_second(self, mock_time):
+        """Test the ISO timestamp is only reformatted when the second changes"""
+        mock_time.return_value = 1700000000.1
+        first = utc_timestamp()
+        mock_time.return_value = 1700000000.9
+        assert utc_timestamp() is first
+        mock_time.return_value = 1700000001.0
+        assert utc_timestamp() == "2023-11-14T22:13:21+00:00"
+
+
 class TestHealthCheck:
     def test_health_check_success(self, client, mock_config):
         """Test health check endpoint"""
@@ -35,6 +165,7 @@ class TestHealthCheck:
         data = json.loads(response.data)
         assert data["status"] in ["success", "warning"]
         assert "timestamp" in data
+        assert response.headers["Cache-Control"] == "no-store"
 
 
 class TestAccountInfo:
@@ -44,13 +175,13 @@ class TestAccountInfo:
         # Mock successful Brevo API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "email": "test@example.com",
             "firstName": "John",
             "lastName": "Doe",
             "companyName": "Test Company",
             "plan": [{"type": "free", "creditsLeft": 100}],
-        }
+        })
         mock_request.return_value = mock_response
 
         response = client.get("/api/account")
@@ -59,13 +190,124 @@ class TestAccountInfo:
         data = json.loads(response.data)
         assert data["status"] == "success"
         assert data["data"]["email"] == "test@example.com"
+        assert data["data"]["plan"] == "free"
+        assert data["data"]["emailCredits"] == 100
+
+    @patch("app.make_brevo_request")
+    def test_get_account_info_cached(self, mock_request, client, mock_config):
+        """Test repeated account lookups are served from cache"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"email": "test@example.com"})
+        mock_request.return_value = mock_response
+
+        first = client.get("/api/account")
+        second = client.get("/api/account")
+
+        assert first.status_code == second.status_code == 200
+        assert json.loads(second.data)["data"]["email"] == "test@example.com"
+        mock_request.assert_called_once()
+
+    @patch("app.make_brevo_request")
+    def test_get_account_info_concurrent_misses(self, mock_request, mock_config):
+        """Test concurrent cache misses share a single Brevo call"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"email": "test@example.com"})
+
+        def slow_request(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_response
+
+        mock_request.side_effect = slow_request
+
+        def fetch():
+            with app.test_client() as thread_client:
+                assert thread_client.get("/api/account").status_code == 200
+
+        threads = [threading.Thread(target=fetch) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_request.assert_called_once()
+
+    @patch("app.make_brevo_request")
+    def test_get_account_info_concurrent_failure(self, mock_request, mock_config):
+        """Test concurrent cache misses share a single failed Brevo call"""
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.content = b"Service Unavailable"
+
+        def slow_request(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_response
+
+        mock_request.side_effect = slow_request
+        statuses = []
+
+        def fetch():
+            with app.test_client() as thread_client:
+                statuses.append(thread_client.get("/api/account").status_code)
+
+        threads = [threading.Thread(target=fetch) for _ in range(5)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert statuses == [503] * 5
+        assert time.monotonic() - started < 0.2
+        mock_request.assert_called_once()
+
+    @patch("app.make_brevo_request")
+    def test_fetch_account_shared_base_exception(self, mock_request, mock_config):
+        """Test waiters are released when the owner is interrupted by a BaseException"""
+        class Interrupted(BaseException):
+            pass
+
+        def interrupted_request(*args, **kwargs):
+            time.sleep(0.05)
+            raise Interrupted()
+
+        mock_request.side_effect = interrupted_request
+        raised = []
+
+        def fetch():
+            try:
+                fetch_account_shared()
+            except Interrupted:
+                raised.append(True)
+
+        threads = [threading.Thread(target=fetch, daemon=True) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=1)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert raised == [True] * 3
+        mock_request.assert_called_once()
+
+    @patch("app.make_brevo_request")
+    def test_get_account_info_trailing_slash(self, mock_request, client, mock_config):
+        """Test a trailing slash is served without a redirect"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"email": "test@example.com"})
+        mock_request.return_value = mock_response
+
+        response = client.get("/api/account/")
+        assert response.status_code == 200
 
     @patch("app.make_brevo_request")
     def test_get_account_info_api_error(self, mock_request, client, mock_config):
         """Test account info with Brevo API error"""
         mock_response = Mock()
         mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
+        mock_response.content = b"Unauthorized"
         mock_request.return_value = mock_response
 
         response = client.get("/api/account")
@@ -73,6 +315,42 @@ class TestAccountInfo:
         
         data = json.loads(response.data)
         assert data["status"] == "error"
+        assert data["details"] == "Unauthorized"
+
+
+class TestGetContacts:
+    @patch("app.make_brevo_request")
+    def test_get_contacts_projects_fields(self, mock_request, client, mock_config):
+        """Test contacts are reduced to the exposed fields"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({
+            "count": 2,
+            "contacts": [
+                {
+                    "id": 1,
+                    "email": "a@example.com",
+                    "attributes": {"FIRSTNAME": "Ann"},
+                    "listIds": [3],
+                    "createdAt": "2024-01-01T00:00:00Z",
+                    "modifiedAt": "2024-01-02T00:00:00Z",
+                    "emailBlacklisted": False,
+                },
+                {"id": 2, "email": "b@example.com"},
+            ],
+        })
+        mock_request.return_value = mock_response
+
+        response = client.get("/api/contacts?limit=2")
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        contacts = data["data"]["contacts"]
+        assert data["data"]["totalCount"] == 2
+        assert "emailBlacklisted" not in contacts[0]
+        assert contacts[0]["attributes"] == {"FIRSTNAME": "Ann"}
+        assert contacts[1]["attributes"] == {}
+        assert contacts[1]["listIds"] == []
 
 
 class TestSendEmail:
@@ -81,7 +359,7 @@ class TestSendEmail:
         """Test successful email sending"""
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {"messageId": "test-123"}
+        mock_response.content = orjson.dumps({"messageId": "test-123"})
         mock_request.return_value = mock_response
 
         email_data = {
@@ -167,6 +445,60 @@ class TestSendCustomEvent:
         data = json.loads(response.data)
         assert data["status"] == "success"
 
+    @patch("app.make_brevo_request")
+    def test_send_event_queued(self, mock_request, client, mock_config):
+        """Test events are accepted with 202 and delivered in the background"""
+        mock_config.async_events = True
+        mock_response = Mock()
+        mock_response.status_code = 204
+        mock_request.return_value = mock_response
+
+        event_data = {"event_name": "video_played", "email_id": "user@example.com"}
+
+        response = client.post(
+            "/api/send-custom-event",
+            data=json.dumps(event_data),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 202
+        assert json.loads(response.data)["status"] == "queued"
+
+        _event_queue.join()
+        mock_request.assert_called_once()
+        assert mock_request.call_args.kwargs["json"]["event_name"] == "video_played"
+
+    @patch("app.enqueue_event")
+    def test_send_event_queued_without_api_key(self, mock_enqueue, client, mock_config):
+        """Test async mode rejects events when no API key is configured"""
+        mock_config.async_events = True
+        mock_config.brevo_api_key = None
+
+        event_data = {"event_name": "video_played", "email_id": "user@example.com"}
+
+        response = client.post(
+            "/api/send-custom-event",
+            data=json.dumps(event_data),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        assert "BREVO_API_KEY" in json.loads(response.data)["message"]
+        mock_enqueue.assert_not_called()
+
+    def test_drain_event_queue_stops_at_deadline(self, mock_config):
+        """Test shutdown stops waiting for undelivered events after the deadline"""
+        mock_config.event_drain_timeout = 0.05
+        stuck_queue = queue.Queue()
+        stuck_queue.put({"event_name": "video_played"})
+
+        with patch("app._event_queue", stuck_queue):
+            started = time.monotonic()
+            _drain_event_queue()
+
+        assert time.monotonic() - started < 1
+        assert stuck_queue.unfinished_tasks == 1
+
     def test_send_event_invalid_json_properties(self, client, mock_config):
         """Test custom event with invalid JSON properties"""
         event_data = {
@@ -187,9 +519,146 @@ class TestSendCustomEvent:
         assert "JSON" in data["message"]
 
 
+class TestSendCustomEvents:
+    @patch("app.make_brevo_request")
+    def test_send_events_batch_success(self, mock_request, client, mock_config):
+        """Test a batch of events is forwarded to Brevo"""
+        mock_response = Mock()
+        mock_response.status_code = 204
+        mock_request.return_value = mock_response
+
+        batch = {
+            "events": [
+                {"event_name": "video_played", "email_id": "a@example.com"},
+                {"event_name": "signup", "email_id": "b@example.com"},
+            ]
+        }
+
+        response = client.post(
+            "/api/send-custom-events",
+            data=json.dumps(batch),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["data"]["processed"] == 2
+        assert data["data"]["failed"] == 0
+        assert mock_request.call_count == 2
+
+    @patch("app.make_brevo_request")
+    def test_send_events_batch_invalid_event(self, mock_request, client, mock_config):
+        """Test an invalid event rejects the batch before anything is sent"""
+        batch = {
+            "events": [
+                {"event_name": "video_played", "email_id": "a@example.com"},
+                {"event_name": "signup", "email_id": "not-an-email"},
+            ]
+        }
+
+        response = client.post(
+            "/api/send-custom-events",
+            data=json.dumps(batch),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert "events[1]" in data["message"]
+        mock_request.assert_not_called()
+
+    @patch("app.make_brevo_request")
+    def test_send_events_batch_charged_per_event(self, mock_request, client, mock_config):
+        """Test each batched event counts against the shared event rate limit"""
+        mock_response = Mock()
+        mock_response.status_code = 204
+        mock_request.return_value = mock_response
+
+        batch = {
+            "events": [
+                {"event_name": "video_played", "email_id": f"user{i}@example.com"}
+                for i in range(10)
+            ]
+        }
+
+        response = client.post(
+            "/api/send-custom-events",
+            data=json.dumps(batch),
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+
+        response = client.post(
+            "/api/send-custom-event",
+            data=json.dumps({"event_name": "signup", "email_id": "late@example.com"}),
+            content_type="application/json",
+        )
+        assert response.status_code == 429
+        assert mock_request.call_count == 10
+
+    @patch("app.make_brevo_request")
+    def test_send_events_batch_partial_timeout(self, mock_request, client, mock_config):
+        """Test a timed out event is reported per index while the others are sent"""
+        mock_response = Mock()
+        mock_response.status_code = 204
+
+        def send(method, endpoint, json=None):
+            if json["identifiers"]["email_id"] == "b@example.com":
+                raise BrevoTimeoutError("Request to Brevo API timed out")
+            return mock_response
+
+        mock_request.side_effect = send
+
+        batch = {
+            "events": [
+                {"event_name": "video_played", "email_id": "a@example.com"},
+                {"event_name": "signup", "email_id": "b@example.com"},
+                {"event_name": "signup", "email_id": "c@example.com"},
+            ]
+        }
+
+        response = client.post(
+            "/api/send-custom-events",
+            data=json.dumps(batch),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 502
+        data = json.loads(response.data)["data"]
+        assert data["processed"] == 2
+        assert data["failed"] == 1
+        assert data["errors"] == [{
+            "index": 1,
+            "status": 504,
+            "details": "Request to Brevo API timed out",
+        }]
+        assert mock_request.call_count == 3
+
+
+class TestRequestSize:
+    def test_oversized_body_rejected(self, client, mock_config):
+        """Test bodies above MAX_CONTENT_LENGTH are rejected up front"""
+        with patch.dict(app.config, {"MAX_CONTENT_LENGTH": 10}):
+            response = client.post(
+                "/api/send-custom-event",
+                data=json.dumps({"event_name": "x" * 100}),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 413
+        data = json.loads(response.data)
+        assert data["status"] == "error"
+
+
 class TestRateLimiting:
-    def test_rate_limiting_applied(self, client, mock_config):
+    @patch("app.make_brevo_request")
+    def test_rate_limiting_applied(self, mock_request, client, mock_config):
         """Test that rate limiting is applied to email endpoint"""
+        mock_response = Mock()
+        mock_response.status_code = 201
+        mock_response.content = orjson.dumps({"messageId": "test-123"})
+        mock_request.return_value = mock_response
+
         # This test would require multiple rapid requests in a real scenario
         # For now, just verify the endpoint exists and rate limiting decorators are applied
         email_data = {
@@ -57,6 +57,14 @@ class TestValidateJSON:
         with pytest.raises(ValidationError, match="must be a JSON object"):
             validate_json_field('"string"', "test_field")
 
+    def test_decoded_object_passthrough(self):
+        result = validate_json_field({"key": "value"}, "test_field")
+        assert result == {"key": "value"}
+
+    def test_decoded_non_object(self):
+        with pytest.raises(ValidationError, match="must be a JSON object"):
+            validate_json_field(["value"], "test_field")
+
 
 class TestValidateEventName:
     def test_valid_event_name(self):
@@ -67,6 +75,14 @@ class TestValidateEventName:
         result = validate_event_name("user signup")
         assert result == "user signup"
 
+    def test_event_name_invalid_characters(self):
+        with pytest.raises(ValidationError, match="can only contain"):
+            validate_event_name("video.played!")
+
+    def test_event_name_separators_only(self):
+        with pytest.raises(ValidationError, match="can only contain"):
+            validate_event_name("__-__")
+
     def test_empty_event_name(self):
         with pytest.raises(ValidationError, match="Event name is required"):
             validate_event_name("")
@@ -3,9 +3,13 @@ Input validation utilities for Brevo API integration
 """
 from email_validator import validate_email, EmailNotValidError
 import bleach
-import json
+import orjson
+import re
 import validators
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, Union
+
+# Letters, digits, spaces, underscores and hyphens, with at least one letter or digit
+_EVENT_NAME_RE = re.compile(r'(?=[\w\- ]*[^\W_])[\w\- ]+')
 
 class ValidationError(Exception):
     """Custom validation error"""
@@ -25,7 +29,9 @@ def validate_email_address(email: str) -> str:
         ValidationError: If email is invalid
     """
     try:
-        validated_email = validate_email(email)
+        # Syntax-only check: a DNS deliverability lookup per request costs a
+        # network round-trip, and Brevo rejects undeliverable recipients itself
+        validated_email = validate_email(email, check_deliverability=False)
         return validated_email.email
     except EmailNotValidError as e:
         raise ValidationError(f"Invalid email address: {str(e)}")
@@ -52,12 +58,12 @@ def sanitize_html_content(content: str) -> str:
     
     return bleach.clean(content, tags=allowed_tags, attributes=allowed_attributes)
 
-def validate_json_field(json_str: str, field_name: str) -> Optional[Dict[str, Any]]:
+def validate_json_field(json_str: Union[str, Dict[str, Any]], field_name: str) -> Optional[Dict[str, Any]]:
     """
     Validate JSON string field
     
     Args:
-        json_str: JSON string to validate
+        json_str: JSON string to validate, or an already-decoded JSON object
         field_name: Name of the field (for error messages)
         
     Returns:
@@ -66,15 +72,23 @@ def validate_json_field(json_str: str, field_name: str) -> Optional[Dict[str, An
     Raises:
         ValidationError: If JSON is invalid
     """
-    if not json_str or not json_str.strip():
+    # Objects sent inline in the request body were decoded with it; don't parse twice
+    if isinstance(json_str, dict):
+        return json_str or None
+    
+    if not json_str:
+        return None
+    if not isinstance(json_str, str):
+        raise ValidationError(f"{field_name} must be a JSON object")
+    if not json_str.strip():
         return None
         
     try:
-        parsed_json = json.loads(json_str)
+        parsed_json = orjson.loads(json_str)
         if not isinstance(parsed_json, dict):
             raise ValidationError(f"{field_name} must be a JSON object")
         return parsed_json
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValidationError(f"Invalid JSON in {field_name}: {str(e)}")
 
 def validate_event_name(event_name: str) -> str:
@@ -100,7 +114,7 @@ def validate_event_name(event_name: str) -> str:
         raise ValidationError("Event name must be 100 characters or less")
     
     # Check for valid characters (alphanumeric, underscore, hyphen)
-    if not event_name.replace('_', '').replace('-', '').replace(' ', '').isalnum():
+    if not _EVENT_NAME_RE.fullmatch(event_name):
         raise ValidationError("Event name can only contain letters, numbers, spaces, underscores, and hyphens")
     
     return event_name
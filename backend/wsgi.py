@@ -0,0 +1,11 @@
+"""
+WSGI entry point for production servers (gunicorn -k gevent)
+"""
+from gevent import monkey
+
+# Must run before anything imports socket/ssl so Brevo calls yield to other requests
+monkey.patch_all()
+
+from app import app  # noqa: E402
+
+__all__ = ['app']